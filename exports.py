@@ -0,0 +1,122 @@
+import csv  # Import the csv module for writing roster and attendance spreadsheets.
+import html  # Import the html module for escaping names in printable pages.
+import os  # Import the os module for building output file paths.
+import shutil  # Import the shutil module for copying the logo next to the printable pages.
+import threading  # Import the threading module for guarding the shared output directory setup.
+from concurrent.futures import ThreadPoolExecutor  # Import the thread pool used to render exports off the UI thread.
+
+# Define the file name the logo is copied to inside the export directory.
+LOGO_FILENAME = "logo.png"
+
+# Function to copy the details of a class so it can be rendered safely on a worker thread.
+def snapshot_class(class_schedule):
+    return {
+        "class_id": class_schedule.class_id,
+        "class_name": class_schedule.class_name,
+        "instructor": class_schedule.instructor,
+        "time": class_schedule.time,
+        "capacity": class_schedule.capacity,
+        "members": [(m.member_id, m.name, m.email) for m in class_schedule.enrolled_members],  # Copy the roster.
+    }
+
+# Function to write the rosters of several classes to a single CSV file.
+def write_rosters_csv(class_snapshots, path):
+    with open(path, 'w', newline='') as f:  # Open the output file in write mode.
+        writer = csv.writer(f)  # Create a CSV writer for the file.
+        writer.writerow(["Class ID", "Class", "Instructor", "Time", "Member ID", "Name", "Email"])  # Write the header row.
+        for snapshot in class_snapshots:  # Iterate through each class.
+            for member_id, name, email in snapshot["members"]:  # Write one row per enrolled member.
+                writer.writerow([snapshot["class_id"], snapshot["class_name"], snapshot["instructor"], snapshot["time"], member_id, name, email])
+    return path  # Return the path of the written file.
+
+# Function to write the check-in/check-out log to a CSV file.
+def write_attendance_csv(attendance_log, path):
+    with open(path, 'w', newline='') as f:  # Open the output file in write mode.
+        writer = csv.DictWriter(f, fieldnames=["time", "member_id", "name", "action"])  # Create a CSV writer for the log entries.
+        writer.writeheader()  # Write the header row.
+        writer.writerows(attendance_log)  # Write one row per log entry.
+    return path  # Return the path of the written file.
+
+# Function to render a printable HTML sign-in sheet with one page per class.
+def render_sign_in_sheet(class_snapshots, date, logo_src=None):
+    pages = []  # List to hold the HTML for each class page.
+    for snapshot in class_snapshots:  # Iterate through each class.
+        rows = "".join(
+            f"<tr><td>{html.escape(member_id)}</td><td>{html.escape(name)}</td><td class='sign'></td></tr>"
+            for member_id, name, _ in snapshot["members"]
+        )  # Build one table row per enrolled member with an empty signature cell.
+        logo = f"<img class='logo' src='{html.escape(logo_src)}' alt='Cardinal Fitness'>" if logo_src else ""  # Reference the shared logo file.
+        pages.append(
+            f"<section class='page'>{logo}"
+            f"<h1>{html.escape(snapshot['class_name'])} Sign-In Sheet</h1>"
+            f"<p>Date: {html.escape(date)} &middot; Time: {html.escape(snapshot['time'])} &middot; "
+            f"Instructor: {html.escape(snapshot['instructor'])} &middot; "
+            f"Enrolled: {len(snapshot['members'])}/{snapshot['capacity']}</p>"
+            f"<table><tr><th>Member ID</th><th>Name</th><th>Signature</th></tr>{rows}</table></section>"
+        )
+
+    style = (
+        "body{font-family:Arial,sans-serif;color:#232323}"
+        ".page{page-break-after:always}.logo{height:80px}h1{color:#ff0000}"
+        "table{width:100%;border-collapse:collapse}th,td{border:1px solid #232323;padding:6px;text-align:left}"
+        "td.sign{width:40%}"
+    )  # Define a simple print-friendly stylesheet.
+    return f"<!DOCTYPE html><html><head><meta charset='utf-8'><title>Sign-In Sheets {html.escape(date)}</title><style>{style}</style></head><body>{''.join(pages)}</body></html>"
+
+# Function to render a sign-in sheet and write it to an HTML file.
+def write_sign_in_sheet(class_snapshots, date, path, logo_src=None):
+    with open(path, 'w', encoding='utf-8') as f:  # Open the output file in write mode.
+        f.write(render_sign_in_sheet(class_snapshots, date, logo_src))  # Write the rendered page.
+    return path  # Return the path of the written file.
+
+# Define the Exporter class to render rosters and sign-in sheets on a pool of worker threads.
+class Exporter:
+    def __init__(self, output_dir, logo_path=None, max_workers=4):
+        # Initialize the exporter with the provided settings.
+        self.output_dir = output_dir  # Directory where exported files are written.
+        self.logo_path = logo_path  # Path of the logo shown on printable pages.
+        self.pool = ThreadPoolExecutor(max_workers=max_workers)  # Worker pool that renders the exports.
+        self.lock = threading.Lock()  # Lock so only one worker sets up the output directory and logo.
+        self.logo_src = None  # Relative path of the copied logo, set once it has been copied.
+
+    # Method to create the output directory and copy the logo into it if it is missing; runs on a worker thread.
+    def prepare_output(self):
+        with self.lock:
+            os.makedirs(self.output_dir, exist_ok=True)  # Create the output directory if needed.
+            logo_copy = os.path.join(self.output_dir, LOGO_FILENAME)  # Path of the shared logo next to the pages.
+            if self.logo_path and not os.path.exists(logo_copy):  # Copy the logo only if it is not already there.
+                try:
+                    shutil.copyfile(self.logo_path, logo_copy)  # Copy the logo next to the pages.
+                    self.logo_src = LOGO_FILENAME
+                except OSError as e:  # Handle exceptions if the logo fails to copy.
+                    print(f"Error copying the logo for exports: {e}")  # Print the error message to the console.
+                    self.logo_path = None  # Render the pages without a logo from now on.
+        return self.output_dir
+
+    # Method run on a worker thread to prepare the output directory and then write one file.
+    def run_task(self, write, filename, *args):
+        path = os.path.join(self.prepare_output(), filename)  # Build the output path once the directory exists.
+        return write(*args, path)
+
+    # Method to queue a CSV export of the given class rosters.
+    def export_rosters(self, classes, filename="rosters.csv"):
+        snapshots = [snapshot_class(c) for c in classes]  # Copy the rosters on the calling thread.
+        return self.pool.submit(self.run_task, write_rosters_csv, filename, snapshots)
+
+    # Method to queue a CSV export of the attendance log.
+    def export_attendance(self, attendance_log, filename="attendance.csv"):
+        entries = list(attendance_log)  # Copy the log on the calling thread.
+        return self.pool.submit(self.run_task, write_attendance_csv, filename, entries)
+
+    # Method to queue one printable sign-in sheet per date for the given classes.
+    def export_sign_in_sheets(self, classes, dates):
+        snapshots = [snapshot_class(c) for c in classes]  # Copy the rosters on the calling thread.
+        return [self.pool.submit(self.run_task, self.write_sign_in_sheet, f"sign_in_{date}.html", snapshots, date) for date in dates]
+
+    # Method to write one sign-in sheet that references the logo copied into the output directory.
+    def write_sign_in_sheet(self, class_snapshots, date, path):
+        return write_sign_in_sheet(class_snapshots, date, path, self.logo_src)
+
+    # Method to stop the worker pool.
+    def shutdown(self):
+        self.pool.shutdown(wait=False)  # Let queued exports finish without blocking the caller.
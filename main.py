@@ -1,11 +1,14 @@
 import json  # Import the json module for handling configuration data stored in JSON format.
 import re  # Import the re module for handling regular expressions.
+from datetime import datetime  # Import datetime for timestamping check-ins and exports.
 import tkinter as tk  # Import the tkinter module for creating the GUI components.
 from PIL import Image, ImageTk  # Import the Pillow library for image manipulation and Tkinter compatibility.
 from tkinter import messagebox  # Import the messagebox module from tkinter for displaying message dialogs.
 from members import Member  # Import the Member class from the members module (custom class for member management).
 from classes import ClassSchedule  # Import the ClassSchedule class from the classes module (custom class for class scheduling).
 from notifications import Notification  # Import the Notification class from the notifications module (custom class for notifications).
+from sessions import SessionSweeper  # Import the SessionSweeper class from the sessions module (custom class for auto check-out).
+from exports import Exporter  # Import the Exporter class from the exports module (custom class for roster and report exports).
 
 # Function to load configuration settings from a JSON file.
 def load_config():
@@ -27,19 +30,30 @@ class FitnessApp(tk.Tk):
         self.config = load_config()  # Load the configuration settings.
         self.default_capacity = self.config['default_class_capacity']  # Set the default class capacity from config.
         self.default_notification_message = self.config['notification_message']  # Set the default notification message.
+        self.auto_check_out_message = self.config['auto_check_out_message']  # Set the message sent on automatic check-out.
+        self.sweep_interval = self.config['sweep_interval_seconds'] * 1000  # Set how often (in ms) stale sessions are swept.
+        self.sweep_batch_size = self.config['sweep_batch_size']  # Set the most check-outs handled per sweep so the UI stays responsive.
 
         self.members = []  # Initialize an empty list to hold the members.
+        self.attendance_log = []  # Initialize an empty list to hold check-in and check-out records.
         # Initialize class schedules with sample classes.
         self.classes = {
             "Yoga": ClassSchedule("C001", "Yoga", "Alice Johnson", "10:00 AM", self.default_capacity),
             "Spinning": ClassSchedule("C002", "Spinning", "John Doe", "12:00 PM", self.default_capacity),
         }
 
+        # Create the sweeper that checks out members who forget to check out.
+        self.sweeper = SessionSweeper(self.config['session_idle_timeout_minutes'], self.config['closing_time'], on_check_out=self.auto_check_out)
+        # Create the exporter that renders rosters and sign-in sheets on worker threads.
+        self.exporter = Exporter(self.config['export_directory'], "assets/Cardinal Fitness Logo.png", self.config['export_workers'])
+
         self.frames = {}  # Dictionary to hold the different frames (pages) of the application.
         self.create_frames()  # Call the method to create all frames (pages).
 
         self.show_frame("MainMenu")  # Show the main menu frame by default.
 
+        self.after(self.sweep_interval, self.sweep_sessions)  # Schedule the first sweep of stale sessions.
+
     # Method to create and configure all the frames/pages of the application.
     def create_frames(self):
         for F in (MainMenu, CheckInFrame, EnrollFrame, ViewClassesFrame):  # Iterate through the different frame classes.
@@ -56,6 +70,24 @@ class FitnessApp(tk.Tk):
         frame = self.frames[page_name]  # Retrieve the frame instance from the frames dictionary.
         frame.tkraise()  # Raise the frame to the top of the stacking order to display it.
 
+    # Method to check out a batch of expired sessions and schedule the next sweep.
+    def sweep_sessions(self):
+        self.sweeper.sweep(self.sweep_batch_size)  # Check out up to one batch of expired sessions.
+        if self.sweeper.has_due():  # Check if sessions are still waiting, e.g. everyone at closing time.
+            self.after(10, self.sweep_sessions)  # Sweep the next batch shortly, letting the UI handle events in between.
+        else:
+            self.after(self.sweep_interval, self.sweep_sessions)  # Schedule the next regular sweep.
+
+    # Callback invoked by the sweeper for each automatically checked-out member.
+    def auto_check_out(self, member, reason):
+        self.record_attendance(member, f"auto check out ({reason})")  # Log the generated check-out.
+        notification = Notification(self.auto_check_out_message, member)  # Create a new notification instance.
+        notification.send_notification()  # Send a notification for the automatic check-out.
+
+    # Method to add a check-in or check-out record to the attendance log.
+    def record_attendance(self, member, action):
+        self.attendance_log.append({"time": datetime.now().isoformat(timespec="seconds"), "member_id": member.member_id, "name": member.name, "action": action})
+
     # Method to exit the fullscreen mode.
     def exit_fullscreen(self, event=None):
         self.attributes('-fullscreen', False)  # Disable the fullscreen attribute.
@@ -230,6 +262,8 @@ class CheckInFrame(tk.Frame):
                 messagebox.showinfo("Already Checked In", f"{member.name}, you are already checked in.")  # Show a message.
             else:
                 member.check_in()  # Mark the member as checked in.
+                self.controller.sweeper.track(member)  # Start the member's auto check-out timer.
+                self.controller.record_attendance(member, "check in")  # Log the check-in.
                 messagebox.showinfo("Check In", f"{member.name} has successfully checked in.")  # Show a success message.
         else:
             messagebox.showwarning("Check In", "Member not found. Please enroll first.")  # Show a warning if the member is not found.
@@ -244,6 +278,8 @@ class CheckInFrame(tk.Frame):
                 messagebox.showinfo("Already Checked Out", f"{member.name}, you are already checked out.")  # Show a message.
             else:
                 member.check_out()  # Mark the member as checked out.
+                self.controller.sweeper.untrack(member)  # Cancel the member's auto check-out timer.
+                self.controller.record_attendance(member, "check out")  # Log the check-out.
                 messagebox.showinfo("Check Out", f"{member.name} has successfully checked out.")  # Show a success message.
         else:
             messagebox.showwarning("Check Out", "Member not found. Please enroll first.")  # Show a warning if the member is not found.
@@ -457,6 +493,10 @@ class ViewClassesFrame(tk.Frame):
         withdraw_button = tk.Button(self, text="Withdraw", command=self.withdraw_member, **button_style)  # Apply the button style.
         withdraw_button.pack(pady=5, anchor='center')  # Position the button.
 
+        # Create and position the Export button.
+        self.export_button = tk.Button(self, text="Export Rosters", command=self.export_reports, **button_style)  # Apply the button style.
+        self.export_button.pack(pady=5, anchor='center')  # Position the button.
+
         self.display_classes()  # Display the class details.
 
         # Create and position the Back to Main Menu button.
@@ -508,6 +548,31 @@ class ViewClassesFrame(tk.Frame):
             class_info += f"{class_name} Class:\nInstructor: {class_obj.instructor}\nTime: {class_obj.time}\nEnrolled Members: {', '.join(enrolled_members)}\n\n"
         self.classes_label.config(text=class_info)  # Update the label to display the formatted class information.
 
+    # Method to export class rosters, the attendance log and today's sign-in sheet without blocking the UI.
+    def export_reports(self):
+        if self.export_button['state'] == 'disabled':  # Ignore clicks while a previous export is still running.
+            return
+        self.export_button.config(state='disabled')  # Disable the button until every export has finished.
+
+        exporter = self.controller.exporter  # Get the shared exporter.
+        classes = list(self.controller.classes.values())  # Get all classes.
+        futures = [exporter.export_rosters(classes), exporter.export_attendance(self.controller.attendance_log)]
+        futures += exporter.export_sign_in_sheets(classes, [datetime.now().date().isoformat()])  # Add today's sign-in sheet.
+        self.after(100, self.check_exports, futures)  # Poll for completion from the UI thread.
+
+    # Method to report on exports once every worker has finished.
+    def check_exports(self, futures):
+        if not all(f.done() for f in futures):  # Check if any export is still rendering.
+            self.after(100, self.check_exports, futures)  # Check again shortly.
+            return
+
+        self.export_button.config(state='normal')  # Allow the next export.
+        errors = [f.exception() for f in futures if f.exception()]  # Collect any export errors.
+        if errors:  # Check if any export failed.
+            messagebox.showwarning("Export", f"Export failed: {errors[0]}")  # Show a warning with the first error.
+        else:
+            messagebox.showinfo("Export", f"Exported {len(futures)} files to {self.controller.exporter.output_dir}.")  # Show a success message.
+
     # Method to sign up a member for a class.
     def sign_up_member(self):
         member_id = self.member_id_entry.get()  # Get the member ID from the entry widget.
@@ -515,6 +580,7 @@ class ViewClassesFrame(tk.Frame):
         member = next((m for m in self.controller.members if m.member_id == member_id), None)  # Find the member by ID.
 
         if member:  # Check if the member exists.
+            self.controller.sweeper.touch(member)  # Refresh the member's idle timer if they are checked in.
             class_schedule = self.controller.classes[selected_class]  # Get the class schedule for the selected class.
         
             if member in class_schedule.enrolled_members:  # Check if the member is already enrolled.
@@ -537,6 +603,7 @@ class ViewClassesFrame(tk.Frame):
         member = next((m for m in self.controller.members if m.member_id == member_id), None)  # Find the member by ID.
     
         if member:  # Check if the member exists.
+            self.controller.sweeper.touch(member)  # Refresh the member's idle timer if they are checked in.
             if member in self.controller.classes[selected_class].enrolled_members:  # Check if the member is enrolled in the class.
                 self.controller.classes[selected_class].enrolled_members.remove(member)  # Remove the member from the enrolled members list.
                 messagebox.showinfo("Withdraw", f"{member.name} has successfully withdrawn from {selected_class}.")  # Show a success message.
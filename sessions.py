@@ -0,0 +1,86 @@
+import heapq  # Import the heapq module for keeping pending session expirations ordered by deadline.
+import time  # Import the time module for reading the current wall-clock time.
+from datetime import datetime, timedelta  # Import datetime helpers for working out the next closing time.
+
+# Define the SessionSweeper class to automatically check out members who forget to check out.
+class SessionSweeper:
+    def __init__(self, idle_timeout_minutes, closing_time=None, on_check_out=None, clock=time.time):
+        # Initialize the sweeper with the provided settings.
+        self.idle_timeout = idle_timeout_minutes * 60  # Seconds a session may stay idle before it is closed.
+        self.closing_time = closing_time  # Daily closing time as an "HH:MM" string, or None to disable.
+        self.on_check_out = on_check_out  # Callback invoked as on_check_out(member, reason) for each generated check-out.
+        self.clock = clock  # Function returning the current time in seconds since the epoch.
+        self.pending = []  # Heap of (deadline, sequence, member_id) entries waiting to expire.
+        self.sessions = {}  # Dictionary mapping member IDs to (member, deadline, sequence, reason).
+        self.sequence = 0  # Counter used to break deadline ties and to spot stale heap entries.
+
+    # Method to calculate the next closing time after the given timestamp.
+    def next_closing(self, now):
+        if not self.closing_time:  # Check if closing time sweeps are disabled.
+            return None
+        hour, minute = (int(part) for part in self.closing_time.split(":"))  # Split the "HH:MM" string.
+        current = datetime.fromtimestamp(now)  # Convert the timestamp to a local datetime.
+        closing = current.replace(hour=hour, minute=minute, second=0, microsecond=0)  # Closing time on the same day.
+        if closing <= current:  # Check if today's closing time has already passed.
+            closing += timedelta(days=1)  # Use tomorrow's closing time instead.
+        return closing.timestamp()  # Return the closing time as a timestamp.
+
+    # Method to start (or restart) tracking a checked-in member's session.
+    def track(self, member):
+        now = self.clock()  # Get the current time.
+        deadline = now + self.idle_timeout  # Expire the session after the idle timeout.
+        reason = "idle"  # Reason reported if the idle timeout is reached first.
+        closing = self.next_closing(now)  # Get the next closing time, if any.
+        if closing is not None and closing <= deadline:  # Check if the gym closes before the idle timeout.
+            deadline = closing  # Expire the session at closing instead.
+            reason = "closing"
+
+        self.sequence += 1  # Advance the sequence so older heap entries for this member become stale.
+        self.sessions[member.member_id] = (member, deadline, self.sequence, reason)  # Record the current session.
+        heapq.heappush(self.pending, (deadline, self.sequence, member.member_id))  # Schedule the expiration.
+
+        if len(self.pending) > 2 * len(self.sessions) + 64:  # Check if stale entries have piled up in the heap.
+            self.compact()  # Rebuild the heap from the live sessions only.
+
+    # Method to rebuild the heap so it only holds entries for live sessions.
+    def compact(self):
+        self.pending = [(deadline, sequence, member_id) for member_id, (_, deadline, sequence, _) in self.sessions.items()]
+        heapq.heapify(self.pending)  # Restore the heap ordering.
+
+    # Method to refresh the idle timer when a checked-in member does something at the front desk.
+    def touch(self, member):
+        if member.member_id in self.sessions:  # Only refresh sessions that are being tracked.
+            self.track(member)  # Re-schedule the expiration from the current time.
+
+    # Method to stop tracking a member who checked out on their own.
+    def untrack(self, member):
+        self.sessions.pop(member.member_id, None)  # Drop the session; its heap entry is skipped when it surfaces.
+
+    # Method to check whether any heap entry is due, so callers know to sweep again soon.
+    def has_due(self):
+        return bool(self.pending) and self.pending[0][0] <= self.clock()
+
+    # Method to check out sessions whose deadline has passed, at most max_checkouts per call.
+    def sweep(self, max_checkouts=None):
+        now = self.clock()  # Get the current time.
+        expired = []  # List to collect the members checked out during this sweep.
+
+        while self.pending and self.pending[0][0] <= now:  # Only look at entries that are due.
+            if max_checkouts is not None and len(expired) >= max_checkouts:  # Leave the rest for the next call.
+                break
+            deadline, sequence, member_id = heapq.heappop(self.pending)  # Take the earliest expiration.
+            session = self.sessions.get(member_id)  # Look up the member's current session.
+            if session is None or session[2] != sequence:  # Skip entries that were untracked or re-scheduled.
+                continue
+
+            member, _, _, reason = session  # Get the member and the reason the session ended.
+            del self.sessions[member_id]  # Stop tracking the session.
+            if not member.checked_in:  # Skip members who were checked out elsewhere.
+                continue
+
+            member.check_out()  # Mark the member as checked out.
+            if self.on_check_out:  # Check if a check-out callback was provided.
+                self.on_check_out(member, reason)  # Emit the generated check-out.
+            expired.append(member)  # Add the member to the expired list.
+
+        return expired  # Return the members that were checked out.
@@ -0,0 +1,270 @@
+import argparse  # Import the argparse module for the command-line interface.
+import contextlib  # Import contextlib for silencing model print statements during replay.
+import csv  # Import the csv module for reading and writing event logs.
+import heapq  # Import the heapq module for scheduling future check-outs in generated streams.
+import os  # Import the os module for the null device used to discard model output.
+import random  # Import the random module for seeded arrival streams.
+import time  # Import the time module for real-time pacing and wall-clock throughput.
+from datetime import datetime  # Import datetime for parsing timestamps in recorded logs.
+from members import Member  # Import the Member class from the members module.
+from classes import ClassSchedule  # Import the ClassSchedule class from the classes module.
+
+# Define the columns used by simulator event logs (a superset of the attendance export columns).
+EVENT_FIELDS = ["time", "member_id", "name", "action", "class_name"]
+
+# Function to look up the arrival rate at a given minute from (minute, arrivals_per_minute) breakpoints.
+def profile_rate(rate_profile, minute):
+    points = sorted(rate_profile)  # Order the breakpoints by minute.
+    if minute <= points[0][0]:  # Hold the first rate before the first breakpoint.
+        return points[0][1]
+    for (m0, r0), (m1, r1) in zip(points, points[1:]):  # Find the segment containing the minute.
+        if minute <= m1:
+            return r0 + (r1 - r0) * (minute - m0) / (m1 - m0)  # Interpolate linearly between breakpoints.
+    return points[-1][1]  # Hold the last rate after the last breakpoint.
+
+# Function to parse a "minute:rate,minute:rate" string into rate profile breakpoints.
+def parse_rate_profile(text):
+    try:
+        points = [(float(minute), float(rate)) for minute, rate in (point.split(":") for point in text.split(","))]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected minute:rate breakpoints, got {text!r}")
+    if any(rate < 0 for _, rate in points) or not any(rate > 0 for _, rate in points):  # Reject profiles with no arrivals.
+        raise argparse.ArgumentTypeError("profile rates must be non-negative with at least one rate above 0")
+    return points
+
+# Function to parse a command-line number that must be greater than 0.
+def positive(convert):
+    def parse(text):
+        value = convert(text)
+        if value <= 0:
+            raise argparse.ArgumentTypeError(f"must be greater than 0, got {text}")
+        return value
+    return parse
+
+# Function to generate a seeded stream of front-desk events.
+# When rate_profile is given it replaces arrivals_per_minute, so ramps and peaks (such as a 6 PM rush) can be modelled.
+# Check-outs due after the end of the stream are not emitted, so members whose stay runs past it stay checked in.
+def generate_events(seed, duration_minutes, arrivals_per_minute, class_names, existing_members=0, new_member_ratio=0.05,
+                    sign_up_ratio=0.3, withdraw_ratio=0.05, mean_stay_minutes=75, rate_profile=None):
+    rng = random.Random(seed)  # Create a random generator so the same seed gives the same stream.
+    duration = duration_minutes * 60  # Length of the stream in seconds.
+    peak = max(rate for _, rate in rate_profile) if rate_profile else arrivals_per_minute  # Highest arrival rate per minute.
+    if peak <= 0:  # Check that the stream has any arrivals at all.
+        raise ValueError("arrival rate must be greater than 0")
+    events = []  # List to hold the generated events.
+    check_outs = []  # Heap of (time, member_id) check-outs waiting to be emitted.
+    members = [f"M{i + 1:03d}" for i in range(existing_members)]  # IDs of members who can arrive.
+    present = set()  # IDs of members currently checked in.
+    signed_up = {}  # Dictionary mapping member IDs to the classes they signed up for.
+
+    def add(t, member_id, action, class_name=""):
+        events.append({"time": round(t, 3), "member_id": member_id, "name": f"Member {member_id}", "action": action, "class_name": class_name})
+
+    def emit_check_outs(until):
+        while check_outs and check_outs[0][0] <= until:  # Emit every check-out that is due by the given time.
+            out_time, member_id = heapq.heappop(check_outs)
+            present.discard(member_id)
+            add(out_time, member_id, "check out")
+
+    t = rng.expovariate(peak / 60)  # Time of the first candidate arrival.
+    while t < duration:  # Keep generating arrivals until the end of the stream.
+        if rate_profile and rng.random() * peak >= profile_rate(rate_profile, t / 60):  # Thin candidates down to the profile rate.
+            t += rng.expovariate(peak / 60)  # Move to the next candidate arrival.
+            continue
+
+        emit_check_outs(t)  # Emit every check-out that is due before this arrival.
+
+        if not members or rng.random() < new_member_ratio:  # Decide whether a new member enrolls.
+            member_id = f"M{len(members) + 1:03d}"  # Generate the next member ID.
+            members.append(member_id)
+            add(t, member_id, "enroll")
+        else:
+            member_id = rng.choice(members)  # Pick an existing member.
+            roll = rng.random()  # Pick what the member does at the desk.
+            if roll < withdraw_ratio and signed_up.get(member_id):  # Withdraw from a class the member signed up for.
+                class_name = signed_up[member_id].pop()
+                add(t, member_id, "withdraw", class_name)
+            elif roll < withdraw_ratio + sign_up_ratio or member_id in present:  # Sign up, including members already checked in.
+                class_name = rng.choice(class_names)
+                signed_up.setdefault(member_id, []).append(class_name)
+                add(t, member_id, "sign up", class_name)
+            else:  # Check in and schedule the matching check-out.
+                present.add(member_id)
+                add(t, member_id, "check in")
+                heapq.heappush(check_outs, (t + rng.expovariate(1 / (mean_stay_minutes * 60)), member_id))
+
+        t += rng.expovariate(peak / 60)  # Move to the next candidate arrival.
+
+    emit_check_outs(duration)  # Flush the check-outs that fall between the last arrival and the end of the stream.
+    return events  # Return the generated events, already in time order.
+
+# Function to write events to a CSV log that can be replayed later.
+def save_event_log(events, path):
+    with open(path, 'w', newline='') as f:  # Open the output file in write mode.
+        writer = csv.DictWriter(f, fieldnames=EVENT_FIELDS)  # Create a CSV writer for the events.
+        writer.writeheader()  # Write the header row.
+        writer.writerows(events)  # Write one row per event.
+    return path  # Return the path of the written file.
+
+# Function to load a simulator log or an exported attendance log for replay.
+def load_event_log(path):
+    with open(path, newline='') as f:  # Open the log file in read mode.
+        rows = list(csv.DictReader(f))  # Read every row.
+
+    events = []  # List to hold the loaded events.
+    start = None  # Timestamp of the first event, used to turn ISO times into offsets.
+    for row in rows:  # Iterate through the log rows.
+        try:
+            t = float(row["time"])  # Simulator logs store offsets in seconds.
+        except ValueError:
+            stamp = datetime.fromisoformat(row["time"]).timestamp()  # Attendance exports store ISO timestamps.
+            start = stamp if start is None else start
+            t = stamp - start
+
+        action = row["action"]
+        if action.startswith("auto check out"):  # Replay automatic check-outs as ordinary check-outs.
+            action = "check out"
+        events.append({"time": t, "member_id": row["member_id"], "name": row["name"], "action": action, "class_name": row.get("class_name") or ""})
+    return events  # Return the loaded events.
+
+# Define the Simulator class to replay front-desk events headlessly against the member and class model.
+class Simulator:
+    def __init__(self, classes, desks=1, service_seconds=20, implicit_members=True, clock=time.monotonic, sleep=time.sleep):
+        # Initialize the simulator with the provided settings.
+        self.classes = classes  # Dictionary mapping class names to ClassSchedule instances.
+        self.desks = desks  # Number of front-desk stations serving the queue.
+        self.service_seconds = service_seconds  # Seconds each desk spends on one transaction.
+        self.implicit_members = implicit_members  # Whether members a log never enrolled are created on first sight.
+        self.clock = clock  # Function returning the current wall-clock time in seconds.
+        self.sleep = sleep  # Function used to wait between events in real-time mode.
+        self.members = {}  # Dictionary mapping member IDs to Member instances.
+
+    # Method to enroll members that exist before the replay starts, without queueing them at the desk.
+    def add_member(self, member_id, name):
+        self.members[member_id] = Member(member_id, name, f"{member_id.lower()}@example.com")  # Create the member.
+        return self.members[member_id]
+
+    # Method to apply a single event to the model and return its outcome.
+    def apply(self, event):
+        action = event["action"]
+        member = self.members.get(event["member_id"])  # Find the member by ID.
+
+        if action == "enroll":  # Mirror EnrollFrame.enroll_member.
+            if member:
+                return "duplicate"
+            self.add_member(event["member_id"], event["name"])
+            return "ok"
+        if not member:  # Every other action needs an enrolled member.
+            if not self.implicit_members:
+                return "not found"
+            member = self.add_member(event["member_id"], event["name"])  # Assume the member enrolled before the log began.
+
+        if action == "check in":  # Mirror CheckInFrame.check_in_member.
+            if member.checked_in:
+                return "duplicate"
+            member.check_in()
+            return "ok"
+        if action == "check out":  # Mirror CheckInFrame.check_out_member.
+            if not member.checked_in:
+                return "duplicate"
+            member.check_out()
+            return "ok"
+
+        class_schedule = self.classes.get(event["class_name"])  # Get the class schedule for the event.
+        if class_schedule is None:
+            return "unknown class"
+        if action == "sign up":  # Mirror ViewClassesFrame.sign_up_member.
+            if member in class_schedule.enrolled_members:
+                return "duplicate"
+            if len(class_schedule.enrolled_members) >= class_schedule.capacity:
+                return "rejected"
+            class_schedule.enroll_member(member)
+            return "ok"
+        if action == "withdraw":  # Mirror ViewClassesFrame.withdraw_member.
+            if member not in class_schedule.enrolled_members:
+                return "not enrolled"
+            class_schedule.enrolled_members.remove(member)
+            return "ok"
+        return "unknown action"
+
+    # Method to replay events and return throughput, queueing delay and rejection statistics.
+    def run(self, events, speed=None):
+        desk_free = [0.0] * self.desks  # Heap of the times at which each desk becomes free.
+        delays = []  # List of queueing delays in seconds.
+        outcomes = {}  # Dictionary counting outcomes by "action: outcome".
+        # Discard the model's console messages so wall-clock throughput measures the model, not stdout.
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            started = self.clock()  # Wall-clock time the replay started.
+            for event in events:  # Replay the events in order.
+                if speed:  # Pace the replay against the wall clock when a speed is given.
+                    wait = event["time"] / speed - (self.clock() - started)
+                    if wait > 0:
+                        self.sleep(wait)
+
+                free_at = heapq.heappop(desk_free)  # Serve the event at the desk that frees up first.
+                start = max(event["time"], free_at)  # The event waits if every desk is busy.
+                delays.append(start - event["time"])
+                heapq.heappush(desk_free, start + self.service_seconds)
+
+                outcome = self.apply(event)  # Apply the event to the model.
+                key = f"{event['action']}: {outcome}"
+                outcomes[key] = outcomes.get(key, 0) + 1
+
+        wall_seconds = self.clock() - started  # Wall-clock time the replay took.
+        span = events[-1]["time"] - events[0]["time"] if events else 0  # Simulated time covered by the events.
+        sign_ups = sum(count for key, count in outcomes.items() if key.startswith("sign up:"))
+        ordered = sorted(delays)
+        return {
+            "events": len(events),
+            "wall_seconds": wall_seconds,
+            "events_per_wall_second": len(events) / wall_seconds if wall_seconds > 0 else float("inf"),
+            "events_per_minute": len(events) / span * 60 if span > 0 else 0.0,
+            "mean_queue_delay": sum(delays) / len(delays) if delays else 0.0,
+            "p95_queue_delay": ordered[int(0.95 * (len(ordered) - 1))] if ordered else 0.0,
+            "max_queue_delay": ordered[-1] if ordered else 0.0,
+            "capacity_rejections": outcomes.get("sign up: rejected", 0),
+            "capacity_rejection_rate": outcomes.get("sign up: rejected", 0) / sign_ups if sign_ups else 0.0,
+            "outcomes": outcomes,
+        }
+
+# The command-line entry point for generating, replaying and measuring event streams.
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulate or replay front-desk traffic.")
+    parser.add_argument("--seed", type=int, default=1, help="Seed for the generated arrival stream.")
+    parser.add_argument("--minutes", type=positive(float), default=60, help="Length of the generated stream in minutes.")
+    parser.add_argument("--rate", type=positive(float), default=2, help="Mean arrivals per minute; keep rate * service / (60 * desks) below 1.")
+    parser.add_argument("--profile", type=parse_rate_profile, default=None,
+                        help="Arrival rate profile as minute:rate breakpoints, e.g. 0:1,45:6,75:6,120:2; replaces --rate.")
+    parser.add_argument("--members", type=int, default=500, help="Members enrolled before the stream starts.")
+    parser.add_argument("--capacity", type=int, default=20, help="Capacity of each simulated class.")
+    parser.add_argument("--desks", type=positive(int), default=1, help="Number of front-desk stations.")
+    parser.add_argument("--service", type=positive(float), default=20, help="Seconds per front-desk transaction.")
+    parser.add_argument("--speed", type=positive(float), default=None, help="Replay speed (1 is real time); omit to run as fast as possible.")
+    parser.add_argument("--replay", help="Replay a recorded event or attendance log instead of generating one.")
+    parser.add_argument("--save", help="Write the replayed events to this CSV log.")
+    args = parser.parse_args()
+
+    classes = {
+        "Yoga": ClassSchedule("C001", "Yoga", "Alice Johnson", "10:00 AM", args.capacity),
+        "Spinning": ClassSchedule("C002", "Spinning", "John Doe", "12:00 PM", args.capacity),
+    }  # Use the same sample classes as the application.
+    simulator = Simulator(classes, desks=args.desks, service_seconds=args.service)  # Create the simulator.
+    if args.replay:
+        events = load_event_log(args.replay)  # Load the recorded log.
+    else:
+        for i in range(args.members):  # Enroll the existing members before the stream starts.
+            simulator.add_member(f"M{i + 1:03d}", f"Member M{i + 1:03d}")
+        events = generate_events(args.seed, args.minutes, args.rate, list(classes), existing_members=args.members, rate_profile=args.profile)
+    if args.save:
+        save_event_log(events, args.save)  # Save the events so the run can be replayed later.
+
+    if not args.replay:
+        peak = max(rate for _, rate in args.profile) if args.profile else args.rate  # Busiest arrival rate in the stream.
+        load = peak * args.service / (60 * args.desks)  # Fraction of desk capacity the stream asks for at its peak.
+        print(f"desk_load: {load:.2f}")
+        if load >= 1:  # Warn that the queue cannot drain while the load stays this high.
+            print("warning: desk load reaches 1, so the queue grows while arrivals stay at that rate; lower --rate or --service, or add --desks.")
+
+    stats = simulator.run(events, speed=args.speed)
+    for key, value in stats.items():  # Print each statistic.
+        print(f"{key}: {value}")
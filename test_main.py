@@ -1,8 +1,16 @@
 # Import necessary modules for testing.
 import unittest  # Unittest framework for creating and running tests.
+from unittest import mock  # Mock module for patching file copies.
 import re  # Regular expression module for email validation.
+import csv  # CSV module for reading exported rosters.
+import os  # OS module for building export file paths.
+import shutil  # Shutil module for cleaning export directories and counting logo copies.
+import tempfile  # Tempfile module for a scratch export directory.
 from members import Member  # Import the Member class from the members module.
 from classes import ClassSchedule  # Import the ClassSchedule class from the classes module.
+from sessions import SessionSweeper  # Import the SessionSweeper class from the sessions module.
+from exports import Exporter  # Import the Exporter class from the exports module.
+from simulation import Simulator, generate_events, save_event_log, load_event_log  # Import the simulation helpers.
 from main import load_config  # Import the load_config function from the main module.
 
 # Test suite for testing member functionality.
@@ -59,6 +67,252 @@ class TestMemberFunctionality(unittest.TestCase):
         self.assertIn('notification_message', config)  # Check for the 'notification_message' key.
         self.assertGreaterEqual(config['default_class_capacity'], 1)  # Verify the capacity is at least 1.
 
+# Test suite for testing the automatic check-out sweeper.
+class TestSessionSweeper(unittest.TestCase):
+
+    # Set up a sweeper driven by a fake clock for each test case.
+    def setUp(self):
+        self.now = 0  # Current fake time in seconds.
+        self.checked_out = []  # List to record the generated check-outs.
+        self.sweeper = SessionSweeper(60, on_check_out=lambda member, reason: self.checked_out.append((member, reason)), clock=lambda: self.now)
+        self.member1 = Member("M001", "John Doe", "johndoe@example.com")  # Create a sample member.
+        self.member2 = Member("M002", "Jane Smith", "janesmith@example.com")  # Create another sample member.
+
+    # Test that idle sessions are checked out only after the timeout.
+    def test_idle_session_checked_out(self):
+        self.member1.check_in()  # Check in the member.
+        self.sweeper.track(self.member1)  # Start tracking the session.
+
+        self.now = 59 * 60  # Move to just before the timeout.
+        self.assertEqual(self.sweeper.sweep(), [])  # Verify nothing has expired yet.
+        self.assertTrue(self.member1.checked_in)  # Verify the member is still checked in.
+
+        self.now = 60 * 60  # Move to the timeout.
+        self.assertEqual(self.sweeper.sweep(), [self.member1])  # Verify the member was swept.
+        self.assertFalse(self.member1.checked_in)  # Verify the member is now checked out.
+        self.assertEqual(self.checked_out, [(self.member1, "idle")])  # Verify the check-out was emitted.
+
+    # Test that touching a session pushes its deadline back.
+    def test_touch_refreshes_deadline(self):
+        self.member1.check_in()  # Check in the member.
+        self.sweeper.track(self.member1)  # Start tracking the session.
+
+        self.now = 30 * 60  # Move halfway to the timeout.
+        self.sweeper.touch(self.member1)  # Refresh the idle timer.
+
+        self.now = 60 * 60  # Move to the original timeout.
+        self.assertEqual(self.sweeper.sweep(), [])  # Verify the stale deadline is ignored.
+        self.now = 90 * 60  # Move to the refreshed timeout.
+        self.assertEqual(self.sweeper.sweep(), [self.member1])  # Verify the member was swept.
+
+    # Test that members who check out themselves are not checked out again.
+    def test_untracked_session_ignored(self):
+        self.member1.check_in()  # Check in the first member.
+        self.member2.check_in()  # Check in the second member.
+        self.sweeper.track(self.member1)  # Start tracking the first session.
+        self.sweeper.track(self.member2)  # Start tracking the second session.
+
+        self.member1.check_out()  # Check out the first member manually.
+        self.sweeper.untrack(self.member1)  # Stop tracking the first session.
+
+        self.now = 60 * 60  # Move to the timeout.
+        self.assertEqual(self.sweeper.sweep(), [self.member2])  # Verify only the second member was swept.
+        self.assertEqual(len(self.checked_out), 1)  # Verify only one check-out was emitted.
+
+    # Test that a capped sweep leaves the remaining due sessions for the next call.
+    def test_capped_sweep(self):
+        members = [Member(f"M{i:03d}", f"Member {i}", f"member{i}@example.com") for i in range(5)]  # Create sample members.
+        for member in members:  # Check in and track every member at the same time.
+            member.check_in()
+            self.sweeper.track(member)
+
+        self.now = 60 * 60  # Move to the shared timeout.
+        self.assertEqual(len(self.sweeper.sweep(max_checkouts=2)), 2)  # Verify only two members were swept.
+        self.assertTrue(self.sweeper.has_due())  # Verify the rest are still due.
+        self.assertEqual(len(self.sweeper.sweep(max_checkouts=2)), 2)  # Verify the next batch.
+        self.assertEqual(len(self.sweeper.sweep(max_checkouts=2)), 1)  # Verify the last member.
+        self.assertFalse(self.sweeper.has_due())  # Verify nothing is left.
+        self.assertTrue(all(not m.checked_in for m in members))  # Verify every member was checked out.
+
+    # Test that sessions are closed at closing time when it comes before the idle timeout.
+    def test_closing_time(self):
+        sweeper = SessionSweeper(24 * 60, closing_time="00:00", clock=lambda: self.now)  # Create a sweeper with a midnight closing.
+        closing = sweeper.next_closing(0)  # Get the next closing time.
+        self.member1.check_in()  # Check in the member.
+        sweeper.track(self.member1)  # Start tracking the session.
+        self.assertEqual(sweeper.sessions["M001"][1], closing)  # Verify the session expires at closing.
+        self.assertEqual(sweeper.sessions["M001"][3], "closing")  # Verify the reason is closing.
+
+# Test suite for testing roster and report exports.
+class TestExports(unittest.TestCase):
+
+    # Set up a class with enrolled members and a scratch export directory.
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()  # Create a temporary directory for exported files.
+        self.exporter = Exporter(self.tmpdir.name, logo_path="assets/Cardinal Fitness Logo.png", max_workers=2)
+        self.class_yoga = ClassSchedule("C001", "Yoga", "Alice Johnson", "10:00 AM", 5)  # Create a sample class.
+        self.class_yoga.enroll_member(Member("M001", "John Doe", "johndoe@example.com"))  # Enroll a sample member.
+        self.class_yoga.enroll_member(Member("M002", "Jane <Smith>", "janesmith@example.com"))  # Enroll a member with markup in their name.
+
+    # Clean up the exporter and scratch directory after each test case.
+    def tearDown(self):
+        self.exporter.shutdown()  # Stop the worker pool.
+        self.tmpdir.cleanup()  # Remove the temporary directory.
+
+    # Test that rosters are written to CSV with one row per enrolled member.
+    def test_export_rosters(self):
+        path = self.exporter.export_rosters([self.class_yoga]).result()  # Wait for the export to finish.
+        with open(path, newline='') as f:
+            rows = list(csv.reader(f))  # Read back the exported rows.
+        self.assertEqual(len(rows), 3)  # Verify the header plus two members.
+        self.assertEqual(rows[1][4:6], ["M001", "John Doe"])  # Verify the first member's row.
+
+    # Test that the attendance log is written to CSV.
+    def test_export_attendance(self):
+        log = [{"time": "2024-01-01T18:00:00", "member_id": "M001", "name": "John Doe", "action": "check in"}]
+        path = self.exporter.export_attendance(log).result()  # Wait for the export to finish.
+        with open(path, newline='') as f:
+            rows = list(csv.DictReader(f))  # Read back the exported rows.
+        self.assertEqual(rows, log)  # Verify the log was written unchanged.
+
+    # Test that one printable sign-in sheet is written per date with escaped names.
+    def test_export_sign_in_sheets(self):
+        futures = self.exporter.export_sign_in_sheets([self.class_yoga], ["2024-01-01", "2024-01-02"])
+        paths = [f.result() for f in futures]  # Wait for every sheet to finish.
+        self.assertEqual([os.path.basename(p) for p in paths], ["sign_in_2024-01-01.html", "sign_in_2024-01-02.html"])
+        with open(paths[0], encoding='utf-8') as f:
+            page = f.read()  # Read back the first sheet.
+        self.assertIn("Yoga Sign-In Sheet", page)  # Verify the class heading.
+        self.assertIn("Jane &lt;Smith&gt;", page)  # Verify names are escaped.
+        self.assertIn("src='logo.png'", page)  # Verify the page references the copied logo.
+        self.assertTrue(os.path.exists(os.path.join(self.tmpdir.name, "logo.png")))  # Verify the logo was copied once.
+
+    # Test that every page references the shared logo and the logo is copied only once across several sheets.
+    def test_sign_in_sheet_logo_once(self):
+        classes = [ClassSchedule(f"C{i:03d}", f"Class {i}", "Alice Johnson", "10:00 AM", 5) for i in range(10)]  # Create several classes.
+        with mock.patch("exports.shutil.copyfile", wraps=shutil.copyfile) as copyfile:  # Count the logo copies.
+            futures = self.exporter.export_sign_in_sheets(classes, ["2024-01-01", "2024-01-02", "2024-01-03"])
+            paths = [f.result() for f in futures]  # Wait for every sheet to finish.
+        self.assertEqual(copyfile.call_count, 1)  # Verify the logo was copied once.
+        with open(paths[0], encoding='utf-8') as f:
+            page = f.read()  # Read back the first sheet.
+        self.assertEqual(page.count("<section"), 10)  # Verify there is one page per class.
+        self.assertEqual(re.findall(r"<img[^>]*src='([^']*)'", page), ["logo.png"] * 10)  # Verify every image uses the shared logo.
+
+    # Test that the logo is copied again when the export directory is removed between exports.
+    def test_logo_recopied_after_cleanup(self):
+        self.exporter.export_sign_in_sheets([self.class_yoga], ["2024-01-01"])[0].result()  # Run a first export.
+        shutil.rmtree(self.tmpdir.name)  # Clean out the export directory.
+        path = self.exporter.export_sign_in_sheets([self.class_yoga], ["2024-01-02"])[0].result()  # Export again.
+        with open(path, encoding='utf-8') as f:
+            self.assertIn("src='logo.png'", f.read())  # Verify the page references the logo.
+        self.assertTrue(os.path.exists(os.path.join(self.tmpdir.name, "logo.png")))  # Verify the logo was copied again.
+
+    # Test that a bad export directory is reported through the future instead of raising on the caller.
+    def test_export_directory_error(self):
+        blocker = os.path.join(self.tmpdir.name, "blocker")  # Path of a file that blocks the export directory.
+        open(blocker, 'w').close()  # Create the blocking file.
+        exporter = Exporter(os.path.join(blocker, "exports"))  # Point the exporter below a regular file.
+        future = exporter.export_rosters([self.class_yoga])  # Queue the export; this must not raise.
+        self.assertIsInstance(future.exception(), OSError)  # Verify the error is reported by the future.
+        exporter.shutdown()  # Stop the worker pool.
+
+# Test suite for testing the front-desk simulator.
+class TestSimulation(unittest.TestCase):
+
+    # Create fresh sample classes for a simulation run.
+    @staticmethod
+    def make_classes(capacity=5):
+        return {
+            "Yoga": ClassSchedule("C001", "Yoga", "Alice Johnson", "10:00 AM", capacity),
+            "Spinning": ClassSchedule("C002", "Spinning", "John Doe", "12:00 PM", capacity),
+        }
+
+    # Test that the same seed always generates the same event stream.
+    def test_generate_events_deterministic(self):
+        first = generate_events(7, 30, 5, ["Yoga", "Spinning"], existing_members=50)  # Generate a stream.
+        second = generate_events(7, 30, 5, ["Yoga", "Spinning"], existing_members=50)  # Generate it again.
+        self.assertEqual(first, second)  # Verify the streams match.
+        self.assertNotEqual(first, generate_events(8, 30, 5, ["Yoga", "Spinning"], existing_members=50))  # Verify the seed matters.
+        self.assertEqual([e["time"] for e in first], sorted(e["time"] for e in first))  # Verify events are in time order.
+
+    # Test that a rate profile concentrates arrivals around its peak.
+    def test_rate_profile(self):
+        profile = [(0, 0.5), (50, 8), (70, 8), (120, 0.5)]  # Ramp up to a rush between minutes 50 and 70.
+        events = generate_events(5, 120, 0, ["Yoga"], existing_members=200, rate_profile=profile)  # Generate the stream.
+        arrivals = [e["time"] for e in events if e["action"] != "check out"]  # Keep only desk arrivals.
+        rush = sum(1 for t in arrivals if 50 * 60 <= t < 70 * 60)  # Arrivals during the rush.
+        quiet = sum(1 for t in arrivals if t < 20 * 60)  # Arrivals during the first 20 quiet minutes.
+        self.assertGreater(rush, 4 * quiet)  # Verify the rush is much busier than the start.
+        self.assertEqual(events, generate_events(5, 120, 0, ["Yoga"], existing_members=200, rate_profile=profile))  # Verify it is seeded.
+
+    # Test that a stream without arrivals is rejected with a clear error.
+    def test_zero_rate_rejected(self):
+        with self.assertRaises(ValueError):
+            generate_events(1, 60, 0, ["Yoga"])  # Zero constant rate.
+        with self.assertRaises(ValueError):
+            generate_events(1, 60, 2, ["Yoga"], rate_profile=[(0, 0), (10, 0)])  # Profile with only zero rates.
+
+    # Test that every arrival produces an event, so the realized rate matches the requested rate.
+    def test_no_arrivals_dropped(self):
+        events = generate_events(4, 600, 2, ["Yoga"], existing_members=5, new_member_ratio=0, mean_stay_minutes=600)
+        arrivals = sum(1 for e in events if e["action"] != "check out")  # Count the desk arrivals.
+        self.assertAlmostEqual(arrivals / 600, 2, delta=0.2)  # Verify about two arrivals per minute, even with everyone checked in.
+
+    # Test that check-outs due before the end of the stream are not dropped.
+    def test_check_outs_flushed(self):
+        events = generate_events(2, 60, 2, ["Yoga"], existing_members=100, sign_up_ratio=0, mean_stay_minutes=0.01)
+        check_ins = sum(1 for e in events if e["action"] == "check in")  # Count the check-ins.
+        check_outs = sum(1 for e in events if e["action"] == "check out")  # Count the check-outs.
+        self.assertGreater(check_ins, 0)  # Verify the stream has check-ins.
+        self.assertLessEqual(check_ins - check_outs, 1)  # Verify only a stay running past the end can be missing.
+        self.assertTrue(all(e["time"] <= 60 * 60 for e in events))  # Verify nothing is emitted past the end.
+
+    # Test that queueing delay and capacity rejections are measured.
+    def test_queue_delay_and_rejections(self):
+        events = [{"time": 0.0, "member_id": f"M{i:03d}", "name": f"Member {i}", "action": "sign up", "class_name": "Yoga"} for i in range(3)]
+        stats = Simulator(self.make_classes(capacity=2), desks=1, service_seconds=10).run(events)  # Replay three simultaneous sign-ups.
+        self.assertEqual(stats["max_queue_delay"], 20)  # Verify the third member waited for two transactions.
+        self.assertEqual(stats["capacity_rejections"], 1)  # Verify the third sign-up was rejected.
+        self.assertAlmostEqual(stats["capacity_rejection_rate"], 1 / 3)  # Verify the rejection rate.
+
+    # Test that a saved event log replays to the same results.
+    def test_save_and_replay(self):
+        events = generate_events(3, 60, 4, ["Yoga", "Spinning"], existing_members=20)  # Generate a stream.
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = save_event_log(events, os.path.join(tmpdir, "events.csv"))  # Save the stream.
+            replayed = load_event_log(path)  # Load it back.
+        original = Simulator(self.make_classes()).run(events)  # Run the original stream.
+        again = Simulator(self.make_classes()).run(replayed)  # Run the replayed stream.
+        self.assertEqual(original["outcomes"], again["outcomes"])  # Verify the outcomes match.
+        self.assertEqual(original["mean_queue_delay"], again["mean_queue_delay"])  # Verify the queueing delay matches.
+
+    # Test that exported attendance logs can be replayed.
+    def test_replay_attendance_log(self):
+        log = [
+            {"time": "2024-01-01T18:00:00", "member_id": "M001", "name": "John Doe", "action": "check in"},
+            {"time": "2024-01-01T18:00:30", "member_id": "M001", "name": "John Doe", "action": "check in"},
+            {"time": "2024-01-01T22:00:00", "member_id": "M001", "name": "John Doe", "action": "auto check out (closing)"},
+        ]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            exporter = Exporter(tmpdir)  # Create an exporter for the scratch directory.
+            events = load_event_log(exporter.export_attendance(log).result())  # Export the log and load it back.
+            exporter.shutdown()  # Stop the worker pool.
+        self.assertEqual([e["time"] for e in events], [0, 30, 4 * 60 * 60])  # Verify times are offsets from the first entry.
+        stats = Simulator(self.make_classes()).run(events)  # Replay the log.
+        self.assertEqual(stats["outcomes"], {"check in: ok": 1, "check in: duplicate": 1, "check out: ok": 1})
+
+    # Test that real-time replay waits for each event's arrival time.
+    def test_real_time_pacing(self):
+        now = [0.0]  # Fake wall clock.
+        waits = []  # List to record requested waits.
+        def sleep(seconds):
+            waits.append(seconds)
+            now[0] += seconds
+        events = [{"time": t, "member_id": "M001", "name": "John Doe", "action": a, "class_name": ""} for t, a in [(10, "check in"), (40, "check out")]]
+        Simulator(self.make_classes(), clock=lambda: now[0], sleep=sleep).run(events, speed=2)  # Replay at double speed.
+        self.assertEqual(waits, [5, 15])  # Verify the replay waited for each event.
+
 # Test suite for validating email addresses.
 class TestValidations(unittest.TestCase):
     # Test for valid email addresses.